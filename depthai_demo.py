@@ -5,13 +5,12 @@ import sys
 
 if sys.version_info[0] < 3:
     raise Exception("Must be using Python 3")
-import argparse
 import json
 import os
+import queue
+import threading
 import time
 import traceback
-from functools import cmp_to_key
-from itertools import cycle
 import platform
 from pathlib import Path
 
@@ -59,6 +58,34 @@ from depthai_sdk.managers import NNetManager, SyncedPreviewManager, PreviewManag
 class OverheatError(RuntimeError):
     pass
 
+
+_DEPTH_QUEUES = frozenset((Previews.disparityColor.name, Previews.disparity.name, Previews.depth.name, Previews.depthRaw.name))
+_DEPTH_RAW_QUEUES = frozenset((Previews.depth.name, Previews.depthRaw.name))
+
+
+_MEDIAN_FILTERS = tuple(item for name, item in vars(dai.MedianFilter).items() if name.startswith(('KERNEL_', 'MEDIAN_')))
+
+# key: (config field, step, min, max, value used if unset, field that has to be set together, its value used if unset,
+#       whether stepping from min starts at 0 so the value stays on the step grid)
+_CAM_KEYS = {
+    ord('t'): ("exposure", 500, 1, 33000, 10000, "sensitivity", 800, True),
+    ord('g'): ("exposure", -500, 1, 33000, 10000, "sensitivity", 800, False),
+    ord('y'): ("sensitivity", 50, 100, 1600, 800, "exposure", 10000, False),
+    ord('h'): ("sensitivity", -50, 100, 1600, 800, "exposure", 10000, False),
+    ord('u'): ("saturation", 1, -10, 10, 0, None, None, False),
+    ord('j'): ("saturation", -1, -10, 10, 0, None, None, False),
+    ord('i'): ("contrast", 1, -10, 10, 0, None, None, False),
+    ord('k'): ("contrast", -1, -10, 10, 0, None, None, False),
+    ord('o'): ("brightness", 1, -10, 10, 0, None, None, False),
+    ord('l'): ("brightness", -1, -10, 10, 0, None, None, False),
+    ord('p'): ("sharpness", 1, 0, 4, 0, None, None, False),
+    ord(';'): ("sharpness", -1, 0, 4, 0, None, None, False),
+}
+
+
+def _denormalizePolygons(polygons, width, height):
+    return (polygons * np.array((width, height), dtype=np.float32)).astype(np.int32)
+
 args = ArgsManager.parseArgs()
 
 if args.noSupervisor and args.guiType == "qt":
@@ -93,23 +120,60 @@ except Exception as ex:
 
 class Trackbars:
     instances = {}
+    peers = {}
+    _suppress = False
 
     @staticmethod
     def createTrackbar(name, window, minVal, maxVal, defaultVal, callback):
+        # other windows showing the same trackbar, extended when a new window registers it
+        existing = Trackbars.instances.get(name, {})
+        peers = [otherWindow for otherWindow in existing if otherWindow != window]
+        if window not in existing:
+            for otherPeers in Trackbars.peers.get(name, {}).values():
+                otherPeers.append(window)
+        Trackbars.peers.setdefault(name, {})[window] = peers
+
         def fn(value):
-            if Trackbars.instances[name][window] != value:
+            # setTrackbarPos below re-enters this callback for the peer windows, which have nothing more to propagate
+            if Trackbars._suppress:
+                return
+            values = Trackbars.instances[name]
+            if values[window] != value:
+                values[window] = value
                 callback(value)
-            for otherWindow, previousValue in Trackbars.instances[name].items():
-                if otherWindow != window and previousValue != value:
-                    Trackbars.instances[name][otherWindow] = value
-                    cv2.setTrackbarPos(name, otherWindow, value)
+            Trackbars._suppress = True
+            try:
+                for otherWindow in peers:
+                    if values[otherWindow] != value:
+                        values[otherWindow] = value
+                        cv2.setTrackbarPos(name, otherWindow, value)
+            finally:
+                Trackbars._suppress = False
 
         cv2.createTrackbar(name, window, minVal, maxVal, fn)
         Trackbars.instances[name] = {**Trackbars.instances.get(name, {}), window: defaultVal}
         cv2.setTrackbarPos(name, window, defaultVal)
 
 
+class CameraConfig:
+    __slots__ = ("exposure", "sensitivity", "saturation", "contrast", "brightness", "sharpness")
+
+    def __init__(self):
+        for field in self.__slots__:
+            setattr(self, field, None)
+
+    def astuple(self):
+        # same order as the positional arguments of PipelineManager.update*CamConfig
+        return (self.exposure, self.sensitivity, self.saturation, self.contrast, self.brightness, self.sharpness)
+
+
+def getAvailableMxids():
+    devices = dai.XLinkConnection.getAllConnectedDevices() if args.debug else dai.Device.getAllAvailableDevices()
+    return frozenset(sys.intern(info.getMxId()) for info in devices)
+
+
 noop = lambda *a, **k: None
+_MISSING = object()
 
 
 class Demo:
@@ -119,6 +183,8 @@ class Demo:
     SIGMA_MAX = int(os.getenv("SIGMA_MAX", 250))
     LRCT_MIN = int(os.getenv("LRCT_MIN", 0))
     LRCT_MAX = int(os.getenv("LRCT_MAX", 10))
+    PREFETCH_FRAMES = int(os.getenv("PREFETCH_FRAMES", 4))
+    CAM_UPDATE_INTERVAL = float(os.getenv("CAM_UPDATE_INTERVAL", 0.03))
     error = None
 
     def run_all(self, conf):
@@ -135,6 +201,8 @@ class Demo:
     def __init__(self, displayFrames=True, onNewFrame = noop, onShowFrame = noop, onNn = noop, onReport = noop, onSetup = noop, onTeardown = noop, onIter = noop, onAppSetup = noop, onAppStart = noop, shouldRun = lambda: True, showDownloadProgress=None):
         self._openvinoVersion = None
         self._displayFrames = displayFrames
+        # (model name, shaves, OpenVINO version) -> blob path, the instance is kept across GUI restarts
+        self._blobPaths = {}
 
         self.onNewFrame = onNewFrame
         self.onShowFrame = onShowFrame
@@ -181,7 +249,8 @@ class Demo:
         if self._conf.args.reportFile:
             reportFileP = Path(self._conf.args.reportFile).with_suffix('.csv')
             reportFileP.parent.mkdir(parents=True, exist_ok=True)
-            self._reportFile = reportFileP.open('a')
+            self._reportFile = reportFileP.open('a', buffering=64 * 1024)
+            self._reportHeaderWritten = self._reportFile.tell() > 0
         self._pm = PipelineManager(openvinoVersion=self._openvinoVersion, lowCapabilities=self._conf.lowCapabilities)
 
         if self._conf.args.xlinkChunkSize is not None:
@@ -209,20 +278,34 @@ class Demo:
         maxUsbSpeed = dai.UsbSpeed.HIGH if self._conf.args.usbSpeed == "usb2" else dai.UsbSpeed.SUPER
         self._device = dai.Device(self._pm.pipeline.getOpenVINOVersion(), self._deviceInfo, maxUsbSpeed)
         self._device.addLogCallback(self._logMonitorCallback)
+        self._mxid = self._device.getMxId()
         if sentryEnabled:
             try:
                 from sentry_sdk import set_user
-                set_user({"mxid": self._device.getMxId()})
+                set_user({"mxid": self._mxid})
             except:
                 pass
         if self._deviceInfo.protocol == dai.XLinkProtocol.X_LINK_USB_VSC:
-            print("USB Connection speed: {}".format(self._device.getUsbSpeed()))
+            usbSpeed = self._device.getUsbSpeed()
+            print("USB Connection speed: {}".format(usbSpeed))
+            if self._conf.args.xlinkChunkSize is None:
+                # pipeline is not started yet, so the chunk size can still be adjusted to the negotiated link
+                if usbSpeed in [dai.UsbSpeed.SUPER, dai.UsbSpeed.SUPER_PLUS]:
+                    self._pm.setXlinkChunkSize(0)
+                elif usbSpeed == dai.UsbSpeed.HIGH and self._conf.args.usbSpeed != "usb2":
+                    self._pm.setXlinkChunkSize(5120)
         self._conf.adjustParamsToDevice(self._device)
         self._conf.adjustPreviewToOptions()
+        self._showSet = set(self._conf.args.show)
+        self._depthDisplayed = bool(_DEPTH_RAW_QUEUES & self._showSet)
         if self._conf.lowBandwidth:
             self._pm.enableLowBandwidth(poeQuality=self._conf.args.poeQuality)
         self._cap = cv2.VideoCapture(self._conf.args.video) if not self._conf.useCamera else None
         self._fps = FPSHandler() if self._conf.useCamera else FPSHandler(self._cap)
+        self._frameSkipMod = 1
+        if self._cap is not None and self._conf.args.fps:
+            # decode only every n-th video frame if the requested FPS is lower than the video's FPS
+            self._frameSkipMod = max(1, round(self._cap.get(cv2.CAP_PROP_FPS) / self._conf.args.fps))
         irDrivers = self._device.getIrDrivers()
         irSetFromCmdLine = any([self._conf.args.irDotBrightness, self._conf.args.irFloodBrightness])
         if irDrivers:
@@ -259,14 +342,17 @@ class Demo:
             self._pm.createSystemLogger()
 
         if self._conf.useNN:
+            blobKey = (self._conf.getModelName(), self._conf.shaves, self._nnManager.openvinoVersion)
+            if blobKey not in self._blobPaths:
+                self._blobPaths[blobKey] = self._blobManager.getBlob(shaves=self._conf.shaves, openvinoVersion=self._nnManager.openvinoVersion)
             self._nn = self._nnManager.createNN(
                 pipeline=self._pm.pipeline, nodes=self._pm.nodes, source=self._conf.getModelSource(),
-                blobPath=self._blobManager.getBlob(shaves=self._conf.shaves, openvinoVersion=self._nnManager.openvinoVersion),
+                blobPath=self._blobPaths[blobKey],
                 useDepth=self._conf.useDepth, minDepth=self._conf.args.minDepth, maxDepth=self._conf.args.maxDepth,
                 sbbScaleFactor=self._conf.args.sbbScaleFactor, fullFov=not self._conf.args.disableFullFovNn,
             )
 
-            self._pm.addNn(nn=self._nn, xoutNnInput=Previews.nnInput.name in self._conf.args.show,
+            self._pm.addNn(nn=self._nn, xoutNnInput=Previews.nnInput.name in self._showSet,
                            xoutSbb=self._conf.args.spatialBoundingBox and self._conf.useDepth)
 
     def run(self):
@@ -279,19 +365,18 @@ class Demo:
         self._logOut = self._device.getOutputQueue("systemLogger", maxSize=30, blocking=False) if len(self._conf.args.report) > 0 else None
 
         if self._conf.useDepth:
-            self._medianFilters = cycle([item for name, item in vars(dai.MedianFilter).items() if name.startswith('KERNEL_') or name.startswith('MEDIAN_')])
-            for medFilter in self._medianFilters:
-                # move the cycle to the current median filter
-                if medFilter == self._pm._depthConfig.postProcessing.median:
-                    break
+            self._medianFilters = _MEDIAN_FILTERS
+            currentMedian = self._pm._depthConfig.postProcessing.median
+            self._medianIdx = self._medianFilters.index(currentMedian) if currentMedian in self._medianFilters else 0
         else:
-            self._medianFilters = []
+            self._medianFilters = ()
 
         if self._conf.useCamera:
             cameras = self._device.getConnectedCameras()
             if dai.CameraBoardSocket.CAM_B in cameras and dai.CameraBoardSocket.CAM_C in cameras:
                 self._pv.collectCalibData(self._device)
 
+            self._cameraConfig = CameraConfig()
             self._updateCameraConfigs({
                 "exposure": self._conf.args.cameraExposure,
                 "sensitivity": self._conf.args.cameraSensitivity,
@@ -307,11 +392,17 @@ class Demo:
 
         self._seqNum = 0
         self._hostFrame = None
+        self._keyPollCnt = 0
+        self._pendingCamUpdate = False
+        self._lastCamUpdate = 0
+        self._debugScratch = None
         self._nnData = []
-        self._sbbRois = []
+        self._sbbPolygons = np.empty((0, 4, 2), dtype=np.float32)
         self.onSetup(self)
 
         try:
+            # started inside the try, so stop() always joins them
+            self._startWorkers()
             while self.shouldRun() and self.canRun():
                 self._fps.nextIter()
                 self.onIter(self)
@@ -326,12 +417,81 @@ class Demo:
         finally:
             self.stop()
 
+    def _startWorkers(self):
+        self._workersStop = threading.Event()
+        self._workers = []
+        if not self._conf.useCamera:
+            self._readQueue = queue.Queue(maxsize=self.PREFETCH_FRAMES)
+            self._workers.append(threading.Thread(target=self._readFrames, daemon=True))
+        elif self._encManager is not None:
+            self._workers.append(threading.Thread(target=self._writeEncoded, daemon=True))
+        self._reportQueue = None
+        if hasattr(self, "_reportFile") and self._logOut is not None:
+            self._reportQueue = queue.Queue()
+            self._workers.append(threading.Thread(target=self._writeReports, daemon=True))
+        for worker in self._workers:
+            worker.start()
+
+    def _stopWorkers(self):
+        if not hasattr(self, "_workers"):
+            return
+        self._workersStop.set()
+        if self._reportQueue is not None:
+            self._reportQueue.put(None)
+        for worker in self._workers:
+            worker.join(timeout=1)
+        self._workers = []
+
+    def _putFrame(self, item):
+        while not self._workersStop.is_set():
+            try:
+                self._readQueue.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                pass
+
+    def _readFrames(self):
+        # decodes video frames ahead of the main loop, None marks the end of the video
+        seqNum = 0
+        try:
+            while not self._workersStop.is_set():
+                if not self._cap.grab():
+                    break
+                rawHostFrame = None
+                if seqNum % self._frameSkipMod == 0:
+                    readCorrectly, rawHostFrame = self._cap.retrieve()
+                    if not readCorrectly:
+                        break
+                self._putFrame((seqNum, rawHostFrame))
+                seqNum += 1
+        finally:
+            self._putFrame(None)
+
+    def _writeEncoded(self):
+        while not self._workersStop.wait(0.005):
+            self._encManager.parseQueues()
+
+    def _writeReports(self):
+        # None is put on the queue once the demo stops, lines queued before it are still written
+        while True:
+            try:
+                line = self._reportQueue.get(timeout=1)
+            except queue.Empty:
+                self._reportFile.flush()
+                continue
+            if line is None:
+                break
+            self._reportFile.write(line)
+        self._reportFile.flush()
+
     def stop(self, *args, **kwargs):
+        self._stopWorkers()
         if hasattr(self, "_device"):
             print("Stopping demo...")
             self._device.close()
             del self._device
             self._fps.printStatus()
+        self._mxid = None
         self._pm.closeDefaultQueues()
         if self._conf.useCamera:
             self._pv.closeQueues()
@@ -370,115 +530,125 @@ class Demo:
             self.stop()
             raise self.error
 
-        if self._conf.useCamera:
+        # bound once per iteration, these are read several times below
+        useCamera = self._conf.useCamera
+        nnManager = self._nnManager
+        fps = self._fps
+        displayFrames = self._displayFrames
+
+        if useCamera:
             self._pv.prepareFrames(callback=self.onNewFrame)
-            if self._encManager is not None:
-                self._encManager.parseQueues()
 
-            if self._sbbOut is not None:
+            if self._sbbOut is not None and self._depthDisplayed:
                 sbb = self._sbbOut.tryGet()
                 if sbb is not None:
-                    self._sbbRois = sbb.getConfigData()
+                    self._sbbPolygons = self._sbbToPolygons(sbb.getConfigData())
                 depthFrames = [self._pv.get(Previews.depthRaw.name), self._pv.get(Previews.depth.name)]
                 for depthFrame in depthFrames:
-                    if depthFrame is None:
+                    if depthFrame is None or len(self._sbbPolygons) == 0:
                         continue
 
-                    for roiData in self._sbbRois:
-                        roi = roiData.roi.denormalize(depthFrame.shape[1], depthFrame.shape[0])
-                        topLeft = roi.topLeft()
-                        bottomRight = roi.bottomRight()
-                        # Display SBB on the disparity map
-                        cv2.rectangle(depthFrame, (int(topLeft.x), int(topLeft.y)), (int(bottomRight.x), int(bottomRight.y)), self._nnManager._bboxColors[0], 2)
+                    # Display SBB on the disparity map
+                    cv2.polylines(depthFrame, _denormalizePolygons(self._sbbPolygons, depthFrame.shape[1], depthFrame.shape[0]), True, nnManager._bboxColors[0], 2)
         else:
-            readCorrectly, rawHostFrame = self._cap.read()
-            if not readCorrectly:
+            try:
+                item = self._readQueue.get(timeout=1)
+            except queue.Empty:
+                return
+            if item is None:
                 raise StopIteration()
 
-            self._nnManager.sendInputFrame(rawHostFrame, self._seqNum)
-            self._seqNum += 1
-            self._hostFrame = rawHostFrame
-            self._fps.tick('host')
+            self._seqNum, rawHostFrame = item
+            if rawHostFrame is not None:
+                if nnManager is not None:
+                    nnManager.sendInputFrame(rawHostFrame, self._seqNum)
+                self._hostFrame = rawHostFrame
+                fps.tick('host')
 
-        if self._nnManager is not None:
-            newData, inNn = self._nnManager.parse()
+        if nnManager is not None:
+            newData, inNn = nnManager.parse()
             if inNn is not None:
                 self.onNn(inNn, newData)
-                self._fps.tick('nn')
+                fps.tick('nn')
             if newData is not None:
                 self._nnData = newData
 
-        if self._conf.useCamera:
-            if self._nnManager is not None:
-                self._nnManager.draw(self._pv, self._nnData)
+        if useCamera:
+            if nnManager is not None:
+                nnManager.draw(self._pv, self._nnData)
             self._pv.showFrames(callback=self._showFramesCallback)
         elif self._hostFrame is not None:
-            debugHostFrame = self._hostFrame.copy()
-            if self._nnManager is not None:
-                self._nnManager.draw(debugHostFrame, self._nnData)
-            self._fps.drawFps(debugHostFrame, "host")
-            if self._displayFrames:
+            if nnManager is None and self._frameSkipMod == 1:
+                # every iteration gets a fresh host frame here, so only FPS is drawn and it can be drawn in place
+                debugHostFrame = self._hostFrame
+            else:
+                if self._debugScratch is None or self._debugScratch.shape != self._hostFrame.shape:
+                    self._debugScratch = np.empty_like(self._hostFrame)
+                np.copyto(self._debugScratch, self._hostFrame)
+                debugHostFrame = self._debugScratch
+                if nnManager is not None:
+                    nnManager.draw(debugHostFrame, self._nnData)
+            fps.drawFps(debugHostFrame, "host")
+            if displayFrames:
                 cv2.imshow("host", debugHostFrame)
 
         if self._logOut:
-            logs = self._logOut.tryGetAll()
-            for log in logs:
-                self._printSysInfo(log)
+            self._writeSysInfoBatch(self._logOut.tryGetAll())
+
+        if self._pendingCamUpdate and time.monotonic() - self._lastCamUpdate > self.CAM_UPDATE_INTERVAL:
+            self._flushCameraConfig()
 
-        if self._displayFrames:
-            key = cv2.waitKey(1)
+        if displayFrames:
+            # pollKey returns immediately, waitKey is still called periodically as not all backends redraw on pollKey
+            self._keyPollCnt += 1
+            if hasattr(cv2, "pollKey") and self._keyPollCnt % 30 != 0:
+                key = cv2.pollKey()
+            else:
+                key = cv2.waitKey(1)
             if key == ord('q'):
                 raise StopIteration()
-            elif key == ord('m'):
-                nextFilter = next(self._medianFilters)
-                self._pm.updateDepthConfig(self._device, median=nextFilter)
+            elif key == ord('m') and len(self._medianFilters) > 0:
+                self._medianIdx = (self._medianIdx + 1) % len(self._medianFilters)
+                self._pm.updateDepthConfig(median=self._medianFilters[self._medianIdx])
 
             if self._conf.args.cameraControls:
-                update = True
-
-                if key == ord('t'):
-                    self._cameraConfig["exposure"] = 10000 if self._cameraConfig["exposure"] is None else 500 if self._cameraConfig["exposure"] == 1 else min(self._cameraConfig["exposure"] + 500, 33000)
-                    if self._cameraConfig["sensitivity"] is None:
-                        self._cameraConfig["sensitivity"] = 800
-                elif key == ord('g'):
-                    self._cameraConfig["exposure"] = 10000 if self._cameraConfig["exposure"] is None else max(self._cameraConfig["exposure"] - 500, 1)
-                    if self._cameraConfig["sensitivity"] is None:
-                        self._cameraConfig["sensitivity"] = 800
-                elif key == ord('y'):
-                    self._cameraConfig["sensitivity"] = 800 if self._cameraConfig["sensitivity"] is None else min(self._cameraConfig["sensitivity"] + 50, 1600)
-                    if self._cameraConfig["exposure"] is None:
-                        self._cameraConfig["exposure"] = 10000
-                elif key == ord('h'):
-                    self._cameraConfig["sensitivity"] = 800 if self._cameraConfig["sensitivity"] is None else max(self._cameraConfig["sensitivity"] - 50, 100)
-                    if self._cameraConfig["exposure"] is None:
-                        self._cameraConfig["exposure"] = 10000
-                elif key == ord('u'):
-                    self._cameraConfig["saturation"] = 0 if self._cameraConfig["saturation"] is None else min(self._cameraConfig["saturation"] + 1, 10)
-                elif key == ord('j'):
-                    self._cameraConfig["saturation"] = 0 if self._cameraConfig["saturation"] is None else max(self._cameraConfig["saturation"] - 1, -10)
-                elif key == ord('i'):
-                    self._cameraConfig["contrast"] = 0 if self._cameraConfig["contrast"] is None else min(self._cameraConfig["contrast"] + 1, 10)
-                elif key == ord('k'):
-                    self._cameraConfig["contrast"] = 0 if self._cameraConfig["contrast"] is None else max(self._cameraConfig["contrast"] - 1, -10)
-                elif key == ord('o'):
-                    self._cameraConfig["brightness"] = 0 if self._cameraConfig["brightness"] is None else min(self._cameraConfig["brightness"] + 1, 10)
-                elif key == ord('l'):
-                    self._cameraConfig["brightness"] = 0 if self._cameraConfig["brightness"] is None else max(self._cameraConfig["brightness"] - 1, -10)
-                elif key == ord('p'):
-                    self._cameraConfig["sharpness"] = 0 if self._cameraConfig["sharpness"] is None else min(self._cameraConfig["sharpness"] + 1, 4)
-                elif key == ord(';'):
-                    self._cameraConfig["sharpness"] = 0 if self._cameraConfig["sharpness"] is None else max(self._cameraConfig["sharpness"] - 1, 0)
-                else:
-                    update = False
+                spec = _CAM_KEYS.get(key)
+                if spec is not None:
+                    field, step, minVal, maxVal, default, pairField, pairDefault, snap = spec
+                    current = getattr(self._cameraConfig, field)
+                    if snap and current == minVal:
+                        current = 0
+                    setattr(self._cameraConfig, field, default if current is None else max(minVal, min(maxVal, current + step)))
+                    if pairField is not None and getattr(self._cameraConfig, pairField) is None:
+                        setattr(self._cameraConfig, pairField, pairDefault)
+                    # sent on a later iteration, so a held key results in at most one device update per interval
+                    self._pendingCamUpdate = True
+
+    def _flushCameraConfig(self):
+        self._pendingCamUpdate = False
+        self._lastCamUpdate = time.monotonic()
+        values = self._cameraConfig.astuple()
+        if self._conf.leftCameraEnabled:
+            self._pm.updateLeftCamConfig(*values)
+        if self._conf.rightCameraEnabled:
+            self._pm.updateRightCamConfig(*values)
+        if self._conf.rgbCameraEnabled:
+            self._pm.updateColorCamConfig(*values)
 
-                if update:
-                    self._updateCameraConfigs()
+    @staticmethod
+    def _sbbToPolygons(roisData):
+        # normalized corner points of each ROI, laid out as (N, 4, 2) so drawing only needs to scale them
+        corners = np.array([
+            (roiData.roi.topLeft().x, roiData.roi.topLeft().y, roiData.roi.bottomRight().x, roiData.roi.bottomRight().y)
+            for roiData in roisData
+        ], dtype=np.float32).reshape(-1, 4)
+        return np.ascontiguousarray(corners[:, [0, 1, 2, 1, 2, 3, 0, 3]].reshape(-1, 4, 2))
 
     def _createQueueCallback(self, queueName):
-        if self._displayFrames and queueName in [Previews.disparityColor.name, Previews.disparity.name, Previews.depth.name, Previews.depthRaw.name]:
+        if self._displayFrames and queueName in _DEPTH_QUEUES:
             Trackbars.createTrackbar('Disparity confidence', queueName, self.DISP_CONF_MIN, self.DISP_CONF_MAX, self._conf.args.disparityConfidenceThreshold,
                      lambda value: self._pm.updateDepthConfig(dct=value))
-            if queueName in [Previews.depthRaw.name, Previews.depth.name]:
+            if queueName in _DEPTH_RAW_QUEUES:
                 Trackbars.createTrackbar('Bilateral sigma', queueName, self.SIGMA_MIN, self.SIGMA_MAX, self._conf.args.sigma,
                          lambda value: self._pm.updateDepthConfig(sigma=value))
             if self._conf.args.stereoLrCheck:
@@ -520,52 +690,59 @@ class Demo:
 
     def _printSysInfo(self, info):
         m = 1024 * 1024 # MiB
+        if "memory" in self._conf.args.report:
+            print(f"Drr used / total - {info.ddrMemoryUsage.used / m:.2f} / {info.ddrMemoryUsage.total / m:.2f} MiB")
+            print(f"Cmx used / total - {info.cmxMemoryUsage.used / m:.2f} / {info.cmxMemoryUsage.total / m:.2f} MiB")
+            print(f"LeonCss heap used / total - {info.leonCssMemoryUsage.used / m:.2f} / {info.leonCssMemoryUsage.total / m:.2f} MiB")
+            print(f"LeonMss heap used / total - {info.leonMssMemoryUsage.used / m:.2f} / {info.leonMssMemoryUsage.total / m:.2f} MiB")
+        if "temp" in self._conf.args.report:
+            t = info.chipTemperature
+            print(f"Chip temperature - average: {t.average:.2f}, css: {t.css:.2f}, mss: {t.mss:.2f}, upa0: {t.upa:.2f}, upa1: {t.dss:.2f}")
+        if "cpu" in self._conf.args.report:
+            print(f"Cpu usage - Leon OS: {info.leonCssCpuUsage.average * 100:.2f}%, Leon RT: {info.leonMssCpuUsage.average * 100:.2f} %")
+        print("----------------------------------------")
+
+    def _formatSysInfo(self, info):
+        data = {}
+        if "memory" in self._conf.args.report:
+            data.update({
+                "ddrUsed": info.ddrMemoryUsage.used,
+                "ddrTotal": info.ddrMemoryUsage.total,
+                "cmxUsed": info.cmxMemoryUsage.used,
+                "cmxTotal": info.cmxMemoryUsage.total,
+                "leonCssUsed": info.leonCssMemoryUsage.used,
+                "leonCssTotal": info.leonCssMemoryUsage.total,
+                "leonMssUsed": info.leonMssMemoryUsage.used,
+                "leonMssTotal": info.leonMssMemoryUsage.total,
+            })
+        if "temp" in self._conf.args.report:
+            data.update({
+                "tempAvg": info.chipTemperature.average,
+                "tempCss": info.chipTemperature.css,
+                "tempMss": info.chipTemperature.mss,
+                "tempUpa0": info.chipTemperature.upa,
+                "tempUpa1": info.chipTemperature.dss,
+            })
+        if "cpu" in self._conf.args.report:
+            data.update({
+                "cpuCssAvg": info.leonCssCpuUsage.average,
+                "cpuMssAvg": info.leonMssCpuUsage.average,
+            })
+
+        self.onReport(data)
+        row = ','.join(map(str, data.values())) + '\n'
+        if not self._reportHeaderWritten:
+            self._reportHeaderWritten = True
+            return ','.join(data.keys()) + '\n' + row
+        return row
+
+    def _writeSysInfoBatch(self, logs):
         if not hasattr(self, "_reportFile"):
-            if "memory" in self._conf.args.report:
-                print(f"Drr used / total - {info.ddrMemoryUsage.used / m:.2f} / {info.ddrMemoryUsage.total / m:.2f} MiB")
-                print(f"Cmx used / total - {info.cmxMemoryUsage.used / m:.2f} / {info.cmxMemoryUsage.total / m:.2f} MiB")
-                print(f"LeonCss heap used / total - {info.leonCssMemoryUsage.used / m:.2f} / {info.leonCssMemoryUsage.total / m:.2f} MiB")
-                print(f"LeonMss heap used / total - {info.leonMssMemoryUsage.used / m:.2f} / {info.leonMssMemoryUsage.total / m:.2f} MiB")
-            if "temp" in self._conf.args.report:
-                t = info.chipTemperature
-                print(f"Chip temperature - average: {t.average:.2f}, css: {t.css:.2f}, mss: {t.mss:.2f}, upa0: {t.upa:.2f}, upa1: {t.dss:.2f}")
-            if "cpu" in self._conf.args.report:
-                print(f"Cpu usage - Leon OS: {info.leonCssCpuUsage.average * 100:.2f}%, Leon RT: {info.leonMssCpuUsage.average * 100:.2f} %")
-            print("----------------------------------------")
-        else:
-            data = {}
-            if "memory" in self._conf.args.report:
-                data = {
-                    **data,
-                    "ddrUsed": info.ddrMemoryUsage.used,
-                    "ddrTotal": info.ddrMemoryUsage.total,
-                    "cmxUsed": info.cmxMemoryUsage.used,
-                    "cmxTotal": info.cmxMemoryUsage.total,
-                    "leonCssUsed": info.leonCssMemoryUsage.used,
-                    "leonCssTotal": info.leonCssMemoryUsage.total,
-                    "leonMssUsed": info.leonMssMemoryUsage.used,
-                    "leonMssTotal": info.leonMssMemoryUsage.total,
-                }
-            if "temp" in self._conf.args.report:
-                data = {
-                    **data,
-                    "tempAvg": info.chipTemperature.average,
-                    "tempCss": info.chipTemperature.css,
-                    "tempMss": info.chipTemperature.mss,
-                    "tempUpa0": info.chipTemperature.upa,
-                    "tempUpa1": info.chipTemperature.dss,
-                }
-            if "cpu" in self._conf.args.report:
-                data = {
-                    **data,
-                    "cpuCssAvg": info.leonCssCpuUsage.average,
-                    "cpuMssAvg": info.leonMssCpuUsage.average,
-                }
-
-            if self._reportFile.tell() == 0:
-                print(','.join(data.keys()), file=self._reportFile)
-            self.onReport(data)
-            print(','.join(map(str, data.values())), file=self._reportFile)
+            for info in logs:
+                self._printSysInfo(info)
+        elif len(logs) > 0:
+            # whole burst goes to the report writer as a single write
+            self._reportQueue.put(''.join(map(self._formatSysInfo, logs)))
 
 
 def prepareConfManager(in_args):
@@ -583,21 +760,42 @@ def prepareConfManager(in_args):
 def runQt():
     from gui.main import DemoQtGui
     from PyQt5.QtWidgets import QMessageBox
-    from PyQt5.QtCore import QObject, pyqtSignal, QRunnable, QThreadPool
+    from PyQt5.QtCore import Qt, QObject, pyqtSignal, pyqtSlot, QRunnable, QThread, QThreadPool, QTimer
 
 
     class WorkerSignals(QObject):
-        updateConfSignal = pyqtSignal(list)
         updateDownloadProgressSignal = pyqtSignal(int, int)
         updatePreviewSignal = pyqtSignal(np.ndarray)
         setDataSignal = pyqtSignal(list)
+        restartRequiredSignal = pyqtSignal(bool)
+        softUpdateSignal = pyqtSignal(list)
+        startSignal = pyqtSignal(int)
         exitSignal = pyqtSignal()
         errorSignal = pyqtSignal(str)
 
-    class Worker(QRunnable):
+    class ConfigTask(QRunnable):
+        def __init__(self, fn, *args, **kwargs):
+            super(ConfigTask, self).__init__()
+            self.fn = fn
+            self.args = args
+            self.kwargs = kwargs
+
+        def run(self):
+            try:
+                self.fn(*self.args, **self.kwargs)
+            except Exception:
+                traceback.print_exc()
+
+    class Worker(QObject):
         def __init__(self, instance, parent, conf, selectedPreview=None):
             super(Worker, self).__init__()
             self.running = False
+            # set while no demo is running on the worker thread
+            self.idle = threading.Event()
+            self.idle.set()
+            # bumped by every GuiApp.start(), a run that outlived its stop() sees a newer id and winds down
+            self.runId = 0
+            self._activeRunId = 0
             self.selectedPreview = selectedPreview
             self.instance = instance
             self.parent = parent
@@ -610,13 +808,25 @@ def runQt():
             }
             self.instance.setCallbacks(**self.file_callbacks)
             self.signals = WorkerSignals()
-            self.signals.exitSignal.connect(self.terminate)
-            self.signals.updateConfSignal.connect(self.updateConf)
+            # run is queued onto the worker thread, the rest must not wait for the running demo to finish
+            self.signals.startSignal.connect(self.run)
+            self.signals.exitSignal.connect(self.onExit, Qt.DirectConnection)
+            self.signals.softUpdateSignal.connect(self.onSoftUpdate, Qt.DirectConnection)
 
 
-        def run(self):
-            self.running = True
-            self.signals.setDataSignal.emit(["restartRequired", False])
+        @pyqtSlot(int)
+        def run(self, runId):
+            try:
+                self._activeRunId = runId
+                if self.running and runId == self.runId:
+                    self.runDemo()
+            finally:
+                # an older run ending must not mark the worker idle while a newer one is queued
+                if runId == self.runId:
+                    self.idle.set()
+
+        def runDemo(self):
+            self.signals.restartRequiredSignal.emit(False)
             self.instance.setCallbacks(shouldRun=self.shouldRun, onShowFrame=self.onShowFrame, onSetup=self.onSetup, onAppSetup=self.onAppSetup, onAppStart=self.onAppStart, showDownloadProgress=self.showDownloadProgress)
             self.conf.args.bandwidth = "auto"
             if self.conf.args.deviceId is None:
@@ -626,10 +836,7 @@ def runQt():
                 else:
                     devices = dai.Device.getAllAvailableDevices()
                 if len(devices) > 0:
-                    defaultDevice = next(map(
-                        lambda info: info.getMxId(),
-                        filter(lambda info: info.protocol == dai.XLinkProtocol.X_LINK_USB_VSC, devices)
-                    ), None)
+                    defaultDevice = next((info.getMxId() for info in devices if info.protocol == dai.XLinkProtocol.X_LINK_USB_VSC), None)
                     if defaultDevice is None:
                         defaultDevice = devices[0].getMxId()
                     self.conf.args.deviceId = defaultDevice
@@ -660,22 +867,25 @@ def runQt():
             except Exception as ex:
                 self.onError(ex)
 
-        def terminate(self):
+        def onExit(self):
             self.running = False
-            self.signals.setDataSignal.emit(["restartRequired", False])
+            self.signals.restartRequiredSignal.emit(False)
 
 
-        def updateConf(self, argsList):
-            self.conf.args = argparse.Namespace(**dict(argsList))
+        def onSoftUpdate(self, argNames):
+            nnManager = getattr(self.instance, "_nnManager", None)
+            if "countLabel" in argNames and nnManager is not None:
+                nnManager.countLabel(self.conf.getCountLabel(nnManager))
 
         def onError(self, ex: Exception):
             self.signals.errorSignal.emit(''.join(traceback.format_tb(ex.__traceback__) + [f"{type(ex).__name__}: {ex}"]))
-            self.signals.setDataSignal.emit(["restartRequired", True])
+            self.signals.restartRequiredSignal.emit(True)
 
         def shouldRun(self):
+            running = self.running and self._activeRunId == self.runId
             if "shouldRun" in self.file_callbacks:
-                return self.running and self.file_callbacks["shouldRun"]()
-            return self.running
+                return running and self.file_callbacks["shouldRun"]()
+            return running
 
         def onShowFrame(self, frame, source):
             if "onShowFrame" in self.file_callbacks:
@@ -701,13 +911,12 @@ def runQt():
         def onSetup(self, instance):
             if "onSetup" in self.file_callbacks:
                 self.file_callbacks["onSetup"](instance)
-            self.signals.updateConfSignal.emit(list(vars(self.conf.args).items()))
             self.signals.setDataSignal.emit(["previewChoices", self.conf.args.show])
             devices = []
             if args.debug:
-                devices = [self.instance._deviceInfo.getMxId()] + list(map(lambda info: info.getMxId(), dai.XLinkConnection.getAllConnectedDevices()))
+                devices = [self.instance._deviceInfo.getMxId()] + [info.getMxId() for info in dai.XLinkConnection.getAllConnectedDevices()]
             else:
-                devices = [self.instance._deviceInfo.getMxId()] + list(map(lambda info: info.getMxId(), dai.Device.getAllAvailableDevices()))
+                devices = [self.instance._deviceInfo.getMxId()] + [info.getMxId() for info in dai.Device.getAllAvailableDevices()]
             self.signals.setDataSignal.emit(["deviceChoices", devices])
             if instance._nnManager is not None:
                 self.signals.setDataSignal.emit(["countLabels", instance._nnManager._labels])
@@ -718,10 +927,30 @@ def runQt():
             self.signals.setDataSignal.emit(["irDotBrightness", self.conf.args.irDotBrightness if self.conf.irEnabled(instance._device) else 0])
             self.signals.setDataSignal.emit(["irFloodBrightness", self.conf.args.irFloodBrightness if self.conf.irEnabled(instance._device) else 0])
             self.signals.setDataSignal.emit(["lrc", self.conf.args.stereoLrCheck])
-            self.signals.setDataSignal.emit(["modelChoices", sorted(self.conf.getAvailableZooModels(), key=cmp_to_key(lambda a, b: -1 if a == "mobilenet-ssd" else 1 if b == "mobilenet-ssd" else -1 if a < b else 1))])
+            self.signals.setDataSignal.emit(["modelChoices", sorted(self.conf.getAvailableZooModels(), key=lambda name: (name != "mobilenet-ssd", name))])
 
 
     class GuiApp(DemoQtGui):
+        # camera config option -> argument storing it as (cameraName, value) pairs
+        CAMERA_CONFIG_ARGS = {
+            "exposure": "cameraExposure",
+            "sensitivity": "cameraSensitivity",
+            "saturation": "cameraSaturation",
+            "contrast": "cameraContrast",
+            "brightness": "cameraBrightness",
+            "sharpness": "cameraSharpness",
+        }
+        CAMERA_FPS_ARGS = {Previews.color.name: "rgbFps", Previews.left.name: "monoFps", Previews.right.name: "monoFps"}
+        # (gui handler parameter, argument it is stored in)
+        DEPTH_CONFIG_ARGS = (("dct", "disparityConfidenceThreshold"), ("sigma", "sigma"), ("lrcThreshold", "lrcThreshold"), ("irLaser", "irDotBrightness"), ("irFlood", "irFloodBrightness"))
+        DEPTH_SETUP_ARGS = (("depthFrom", "minDepth"), ("depthTo", "maxDepth"), ("subpixel", "subpixel"), ("extended", "extendedDisparity"), ("lrc", "stereoLrCheck"))
+        AI_SETUP_ARGS = (("cnn", "cnnModel"), ("shave", "shaves"), ("source", "camera"), ("sbb", "spatialBoundingBox"), ("sbbFactor", "sbbScaleFactor"), ("ov", "openvinoVersion"))
+        MEDIAN_SIZES = {dai.MedianFilter.MEDIAN_OFF: 0, dai.MedianFilter.KERNEL_3x3: 3, dai.MedianFilter.KERNEL_5x5: 5, dai.MedianFilter.KERNEL_7x7: 7}
+        # args applied to the running demo by Worker.onSoftUpdate, changing only these does not need a restart
+        LIVE_ARGS = frozenset({"countLabel"})
+        CONFIG_DEBOUNCE_MS = int(os.getenv("CONFIG_DEBOUNCE_MS", 50))
+        DEVICE_POLL_INTERVAL = float(os.getenv("DEVICE_POLL_INTERVAL", 0.1))
+
         def __init__(self):
             super().__init__()
             self.confManager = prepareConfManager(args)
@@ -729,14 +958,61 @@ def runQt():
             self.selectedPreview = self.confManager.args.show[0] if len(self.confManager.args.show) > 0 else "color"
             self.useDisparity = False
             self.dataInitialized = False
-            self.appInitialized = False
-            self.threadpool = QThreadPool()
+            # device config updates from the GUI run here instead of blocking the Qt event loop, one at a time to keep their order
+            self.configPool = QThreadPool()
+            self.configPool.setMaxThreadCount(1)
+            # sliders emit on every step, only the last values of a burst are sent to the device
+            self._debouncers = {}
+            self._pending = {}
             self._demoInstance = Demo(displayFrames=False)
+            # a single worker lives on its own thread for the whole app, restarts only signal it
+            self.workerThread = QThread()
+            self.worker = Worker(self._demoInstance, parent=self, conf=self.confManager, selectedPreview=self.selectedPreview)
+            self.worker.moveToThread(self.workerThread)
+            self.worker.signals.updatePreviewSignal.connect(self.updatePreview)
+            self.worker.signals.updateDownloadProgressSignal.connect(self.updateDownloadProgress)
+            self.worker.signals.setDataSignal.connect(self.setData)
+            self.worker.signals.restartRequiredSignal.connect(self.setRestartRequired)
+            self.worker.signals.errorSignal.connect(self.showError)
+            self.workerThread.start()
 
         def updateArg(self, arg_name, arg_value, shouldUpdate=True):
-            setattr(self.confManager.args, arg_name, arg_value)
-            if shouldUpdate:
-                self.worker.signals.setDataSignal.emit(["restartRequired", True])
+            self.updateArgs(shouldUpdate, **{arg_name: arg_value})
+
+        def updateArgs(self, shouldUpdate=True, **kwargs):
+            # panels re-send unchanged fields, those must not trigger a restart
+            kwargs = {arg_name: arg_value for arg_name, arg_value in kwargs.items() if getattr(self.confManager.args, arg_name, _MISSING) != arg_value}
+            # a whole panel change results in a single restartRequired notification
+            for arg_name, arg_value in kwargs.items():
+                setattr(self.confManager.args, arg_name, arg_value)
+            if shouldUpdate and len(kwargs) > 0:
+                if self.LIVE_ARGS.issuperset(kwargs):
+                    self.worker.signals.softUpdateSignal.emit(list(kwargs))
+                else:
+                    self.worker.signals.restartRequiredSignal.emit(True)
+
+        def debounceConfig(self, category, fn, **kwargs):
+            _, pending = self._pending.get(category, (None, {}))
+            pending.update(kwargs)
+            self._pending[category] = (fn, pending)
+            if category not in self._debouncers:
+                timer = QTimer()
+                timer.setSingleShot(True)
+                timer.setInterval(self.CONFIG_DEBOUNCE_MS)
+                timer.timeout.connect(lambda: self.flushConfig(category))
+                self._debouncers[category] = timer
+            self._debouncers[category].start()
+
+        def flushConfig(self, category):
+            if category in self._pending:
+                fn, kwargs = self._pending.pop(category)
+                self.configPool.start(ConfigTask(fn, **kwargs))
+
+        def dropPendingConfig(self):
+            # values are already stored in args, so the restarted pipeline is created with them anyway
+            for timer in self._debouncers.values():
+                timer.stop()
+            self._pending.clear()
 
 
         def showError(self, error):
@@ -750,44 +1026,41 @@ def runQt():
 
         def start(self):
             self.running = True
-            self.worker = Worker(self._demoInstance, parent=self, conf=self.confManager, selectedPreview=self.selectedPreview)
-            self.worker.signals.updatePreviewSignal.connect(self.updatePreview)
-            self.worker.signals.updateDownloadProgressSignal.connect(self.updateDownloadProgress)
-            self.worker.signals.setDataSignal.connect(self.setData)
-            self.worker.signals.errorSignal.connect(self.showError)
-            self.threadpool.start(self.worker)
-            if not self.appInitialized:
-                self.appInitialized = True
-                exit_code = self.startGui()
-                self.stop(wait=False)
-                sys.exit(exit_code)
+            self.worker.selectedPreview = self.selectedPreview
+            self.worker.runId += 1
+            self.worker.running = True
+            self.worker.idle.clear()
+            self.worker.signals.startSignal.emit(self.worker.runId)
+
+        def run(self):
+            self.start()
+            exit_code = self.startGui()
+            self.stop(wait=False)
+            self.workerThread.quit()
+            self.workerThread.wait()
+            sys.exit(exit_code)
 
         def stop(self, wait=True):
-            if hasattr(self._demoInstance, "_device"):
-                try:
-                    current_mxid = self._demoInstance._device.getMxId()
-                except:
-                    current_mxid = self.confManager.args.deviceId
-                    del self._demoInstance._device
-            else:
-                current_mxid = self.confManager.args.deviceId
+            if hasattr(self._demoInstance, "_device") and self._demoInstance._device.isClosed():
+                del self._demoInstance._device
+            # read before signaling exit, Demo.stop clears it on the worker thread
+            current_mxid = getattr(self._demoInstance, "_mxid", None) or self.confManager.args.deviceId
             self.worker.running = False
             self.worker.signals.exitSignal.emit()
-            self.threadpool.waitForDone(10000)
+            # the worker winds down the demo meanwhile
+            self.dropPendingConfig()
+            if not self.worker.idle.wait(10):
+                print("[Warning] Demo did not stop within 10 seconds!")
 
             if wait and current_mxid is not None:
-                start = time.time()
-                while time.time() - start < 30:
-                    localDevices = []
-                    if args.debug:
-                        localDevices = list(map(lambda info: info.getMxId(), dai.XLinkConnection.getAllConnectedDevices()))
-                    else:
-                        localDevices = list(map(lambda info: info.getMxId(), dai.Device.getAllAvailableDevices()))
-
-                    if current_mxid in localDevices:
+                # interned like the MxIDs from getAvailableMxids, so lookups compare by identity
+                current_mxid = sys.intern(current_mxid)
+                # depthai has no device arrival callback, so the device list is polled until it shows up again
+                start = time.monotonic()
+                while time.monotonic() - start < 30:
+                    if current_mxid in getAvailableMxids():
                         break
-                    else:
-                        time.sleep(0.1)
+                    time.sleep(self.DEVICE_POLL_INTERVAL)
                 else:
                     print(f"[Warning] Device not available again after 30 seconds! MXID: {current_mxid}")
 
@@ -799,104 +1072,57 @@ def runQt():
             self.stop(wait=False)
             self.app.quit()
 
-        def guiOnDepthConfigUpdate(self, median=None, dct=None, sigma=None, lrcThreshold=None, irLaser=None, irFlood=None):
-            self._demoInstance._pm.updateDepthConfig(median=median, dct=dct, sigma=sigma, lrcThreshold=lrcThreshold)
-            if median is not None:
-                if median == dai.MedianFilter.MEDIAN_OFF:
-                    self.updateArg("stereoMedianSize", 0, False)
-                elif median == dai.MedianFilter.KERNEL_3x3:
-                    self.updateArg("stereoMedianSize", 3, False)
-                elif median == dai.MedianFilter.KERNEL_5x5:
-                    self.updateArg("stereoMedianSize", 5, False)
-                elif median == dai.MedianFilter.KERNEL_7x7:
-                    self.updateArg("stereoMedianSize", 7, False)
-            if dct is not None:
-                self.updateArg("disparityConfidenceThreshold", dct, False)
-            if sigma is not None:
-                self.updateArg("sigma", sigma, False)
-            if lrcThreshold is not None:
-                self.updateArg("lrcThreshold", lrcThreshold, False)
-            if any([irLaser, irFlood]):
-                self._demoInstance._pm.updateIrConfig(self._demoInstance._device, irLaser, irFlood)
-                if irLaser is not None:
-                    self.updateArg("irDotBrightness", irLaser, False)
-                if irFlood is not None:
-                    self.updateArg("irFloodBrightness", irFlood, False)
+        def guiOnDepthConfigUpdate(self, **kwargs):
+            depthConfig = {key: kwargs[key] for key in ("median", "dct", "sigma", "lrcThreshold") if kwargs.get(key) is not None}
+            if len(depthConfig) > 0:
+                self.debounceConfig("depth", self._demoInstance._pm.updateDepthConfig, **depthConfig)
+            if any([kwargs.get("irLaser"), kwargs.get("irFlood")]):
+                irConfig = {key: kwargs[key] for key in ("irLaser", "irFlood") if kwargs.get(key) is not None}
+                self.debounceConfig("ir", self._demoInstance._pm.updateIrConfig, device=self._demoInstance._device, **irConfig)
+            pending = {argName: kwargs[key] for key, argName in self.DEPTH_CONFIG_ARGS if kwargs.get(key) is not None}
+            if kwargs.get("median") in self.MEDIAN_SIZES:
+                pending["stereoMedianSize"] = self.MEDIAN_SIZES[kwargs["median"]]
+            self.updateArgs(False, **pending)
 
         def guiOnCameraConfigUpdate(self, name, exposure=None, sensitivity=None, saturation=None, contrast=None, brightness=None, sharpness=None):
-            print(name)
             config = {}
-            if exposure is not None:
-                newValue = list(filter(lambda item: item[0] == name, (self.confManager.args.cameraExposure or []))) + [(name, exposure)]
-                config["exposure"] = newValue
-                self.updateArg("cameraExposure", newValue, False)
-            if sensitivity is not None:
-                newValue = list(filter(lambda item: item[0] == name, (self.confManager.args.cameraSensitivity or []))) + [(name, sensitivity)]
-                config["sensitivity"] = newValue
-                self.updateArg("cameraSensitivity", newValue, False)
-            if saturation is not None:
-                newValue = list(filter(lambda item: item[0] == name, (self.confManager.args.cameraSaturation or []))) + [(name, saturation)]
-                config["saturation"] = newValue
-                self.updateArg("cameraSaturation", newValue, False)
-            if contrast is not None:
-                newValue = list(filter(lambda item: item[0] == name, (self.confManager.args.cameraContrast or []))) + [(name, contrast)]
-                config["contrast"] = newValue
-                self.updateArg("cameraContrast", newValue, False)
-            if brightness is not None:
-                newValue = list(filter(lambda item: item[0] == name, (self.confManager.args.cameraBrightness or []))) + [(name, brightness)]
-                config["brightness"] = newValue
-                self.updateArg("cameraBrightness", newValue, False)
-            if sharpness is not None:
-                newValue = list(filter(lambda item: item[0] == name, (self.confManager.args.cameraSharpness or []))) + [(name, sharpness)]
-                config["sharpness"] = newValue
-                self.updateArg("cameraSharpness", newValue, False)
-
-            self._demoInstance._updateCameraConfigs(config)
-
-        def guiOnDepthSetupUpdate(self, depthFrom=None, depthTo=None, subpixel=None, extended=None, lrc=None):
-            if depthFrom is not None:
-                self.updateArg("minDepth", depthFrom)
-            if depthTo is not None:
-                self.updateArg("maxDepth", depthTo)
-            if subpixel is not None:
-                self.updateArg("subpixel", subpixel)
-            if extended is not None:
-                self.updateArg("extendedDisparity", extended)
-            if lrc is not None:
-                self.updateArg("stereoLrCheck", lrc)
+            for option, value in (("exposure", exposure), ("sensitivity", sensitivity), ("saturation", saturation), ("contrast", contrast), ("brightness", brightness), ("sharpness", sharpness)):
+                if value is not None:
+                    argName = self.CAMERA_CONFIG_ARGS[option]
+                    newValue = [item for item in (getattr(self.confManager.args, argName) or []) if item[0] != name] + [(name, value)]
+                    self.updateArg(argName, newValue, False)
+                    config[option] = value
+
+            if len(config) > 0:
+                self.debounceConfig(name, self._updateCameraConfig, name=name, **config)
+
+        def _updateCameraConfig(self, name, **config):
+            self._demoInstance._updateCameraConfigs({option: [(name, value)] for option, value in config.items()})
+
+        def guiOnDepthSetupUpdate(self, **kwargs):
+            self.updateArgs(**{argName: kwargs[key] for key, argName in self.DEPTH_SETUP_ARGS if kwargs.get(key) is not None})
 
         def guiOnCameraSetupUpdate(self, name, fps=None, resolution=None):
+            pending = {}
             if fps is not None:
-                if name == "color":
-                    self.updateArg("rgbFps", fps)
-                else:
-                    self.updateArg("monoFps", fps)
+                pending[self.CAMERA_FPS_ARGS[name]] = fps
             if resolution is not None:
                 if name == "color":
                     res = getRgbResolution(resolution)
-                    self.updateArg("rgbResolution", res)
+                    pending["rgbResolution"] = res
                     # Not ideal, we need to refactor this (throw the whole SDK away)
-                    self.updateArg("rgbResWidth", self.confManager.rgbResolutionWidth(res))
+                    pending["rgbResWidth"] = self.confManager.rgbResolutionWidth(res)
                 else:
-                    self.updateArg("monoResolution", getMonoResolution(resolution))
-
-        def guiOnAiSetupUpdate(self, cnn=None, shave=None, source=None, fullFov=None, sbb=None, sbbFactor=None, ov=None, countLabel=None):
-            if cnn is not None:
-                self.updateArg("cnnModel", cnn)
-            if shave is not None:
-                self.updateArg("shaves", shave)
-            if source is not None:
-                self.updateArg("camera", source)
-            if fullFov is not None:
-                self.updateArg("disableFullFovNn", not fullFov)
-            if sbb is not None:
-                self.updateArg("spatialBoundingBox", sbb)
-            if sbbFactor is not None:
-                self.updateArg("sbbScaleFactor", sbbFactor)
-            if ov is not None:
-                self.updateArg("openvinoVersion", ov)
-            if countLabel is not None or cnn is not None:
-                self.updateArg("countLabel", countLabel)
+                    pending["monoResolution"] = getMonoResolution(resolution)
+            self.updateArgs(**pending)
+
+        def guiOnAiSetupUpdate(self, **kwargs):
+            pending = {argName: kwargs[key] for key, argName in self.AI_SETUP_ARGS if kwargs.get(key) is not None}
+            if kwargs.get("fullFov") is not None:
+                pending["disableFullFovNn"] = not kwargs["fullFov"]
+            if kwargs.get("countLabel") is not None or kwargs.get("cnn") is not None:
+                pending["countLabel"] = kwargs.get("countLabel")
+            self.updateArgs(**pending)
 
         def guiOnPreviewChangeSelected(self, selected):
             self.worker.selectedPreview = selected
@@ -908,14 +1134,14 @@ def runQt():
         def guiOnReloadDevices(self):
             devices = []
             if args.debug:
-                devices = list(map(lambda info: info.getMxId(), dai.XLinkConnection.getAllConnectedDevices()))
+                devices = [info.getMxId() for info in dai.XLinkConnection.getAllConnectedDevices()]
             else:
-                devices = list(map(lambda info: info.getMxId(), dai.Device.getAllAvailableDevices()))
+                devices = [info.getMxId() for info in dai.Device.getAllAvailableDevices()]
             if hasattr(self._demoInstance, "_deviceInfo"):
                 devices.insert(0, self._demoInstance._deviceInfo.getMxId())
             self.worker.signals.setDataSignal.emit(["deviceChoices", devices])
             if len(devices) > 0:
-                self.worker.signals.setDataSignal.emit(["restartRequired", True])
+                self.worker.signals.restartRequiredSignal.emit(True)
 
         def guiOnStaticticsConsent(self, value):
             try:
@@ -923,7 +1149,7 @@ def runQt():
                     json.dump({"statistics": value}, f)
             except:
                 pass
-            self.worker.signals.setDataSignal.emit(["restartRequired", True])
+            self.worker.signals.restartRequiredSignal.emit(True)
 
         def guiOnToggleSync(self, value):
             self.updateArg("sync", value)
@@ -932,26 +1158,26 @@ def runQt():
             self.updateArg("noRgbDepthAlign", value)
 
         def guiOnToggleColorEncoding(self, enabled, fps):
-            oldConfig = self.confManager.args.encode or {}
+            oldConfig = dict(self.confManager.args.encode or {})
             if enabled:
                 oldConfig["color"] = fps
-            elif "color" in self.confManager.args.encode:
+            elif "color" in oldConfig:
                 del oldConfig["color"]
             self.updateArg("encode", oldConfig)
 
         def guiOnToggleLeftEncoding(self, enabled, fps):
-            oldConfig = self.confManager.args.encode or {}
+            oldConfig = dict(self.confManager.args.encode or {})
             if enabled:
                 oldConfig["left"] = fps
-            elif "color" in self.confManager.args.encode:
+            elif "left" in oldConfig:
                 del oldConfig["left"]
             self.updateArg("encode", oldConfig)
 
         def guiOnToggleRightEncoding(self, enabled, fps):
-            oldConfig = self.confManager.args.encode or {}
+            oldConfig = dict(self.confManager.args.encode or {})
             if enabled:
                 oldConfig["right"] = fps
-            elif "color" in self.confManager.args.encode:
+            elif "right" in oldConfig:
                 del oldConfig["right"]
             self.updateArg("encode", oldConfig)
 
@@ -1032,7 +1258,7 @@ def runQt():
     signal.signal(signal.SIGINT, app.stopGui)
     signal.signal(signal.SIGTERM, app.stopGui)
     atexit.register(app.stopGui)
-    app.start()
+    app.run()
 
 
 def runOpenCv():
@@ -4,6 +4,7 @@ from pathlib import Path
 
 import blobconverter
 import cv2
+import numpy as np
 from PyQt5.QtQml import QQmlApplicationEngine, qmlRegisterType, qmlRegisterSingletonType, QQmlEngine
 from PyQt5.QtQuick import QQuickPaintedItem
 from PyQt5.QtGui import QImage
@@ -22,6 +23,11 @@ try:
 except:
     colorMode = QImage.Format_RGB888
 
+medianChoices = [name for name in vars(dai.MedianFilter) if name.startswith(('KERNEL_', 'MEDIAN_'))][::-1]
+colorResolutionChoices = [name for name in vars(dai.ColorCameraProperties.SensorResolution) if name[0].isupper()]
+monoResolutionChoices = [name for name in vars(dai.MonoCameraProperties.SensorResolution) if name[0].isupper()]
+ovVersionChoices = sorted((name for name in vars(dai.OpenVINO) if name.startswith("VERSION_")), reverse=True)
+
 class Singleton(type(QQuickPaintedItem)):
     _instances = {}
     def __call__(cls, *args, **kwargs):
@@ -299,6 +305,7 @@ class DemoQtGui:
     writer = None
     window = None
     progressFrame = None
+    previewFrame = None
 
     def __init__(self):
         global instance
@@ -323,15 +330,22 @@ class DemoQtGui:
         name, value = data
         self.window.setProperty(name, value)
 
+    def setRestartRequired(self, value):
+        self.window.setProperty("restartRequired", value)
+
     def updatePreview(self, frame):
         w, h = int(self.writer.width()), int(self.writer.height())
         scaledFrame = resizeLetterbox(frame, (w, h))
         if len(frame.shape) == 3:
             if colorMode == QImage.Format_RGB888:
                 scaledFrame = cv2.cvtColor(scaledFrame, cv2.COLOR_RGB2BGR)
-            img = QImage(scaledFrame.data, w, h, frame.shape[2] * w, colorMode)
+            scaledFrame = np.ascontiguousarray(scaledFrame)
+            img = QImage(scaledFrame.data, w, h, scaledFrame.strides[0], colorMode)
         else:
-            img = QImage(scaledFrame.data, w, h, w, QImage.Format_Grayscale8)
+            scaledFrame = np.ascontiguousarray(scaledFrame)
+            img = QImage(scaledFrame.data, w, h, scaledFrame.strides[0], QImage.Format_Grayscale8)
+        # QImage wraps the buffer without copying it, so the array has to outlive the displayed image
+        self.previewFrame = scaledFrame
         self.writer.update_frame(img)
 
     def updateDownloadProgress(self, curr, total):
@@ -371,14 +385,10 @@ class DemoQtGui:
     def startGui(self):
         self.writer = self.window.findChild(QObject, "writer")
         self.showSetupFrame("Starting demo...")
-        medianChoices = list(filter(lambda name: name.startswith('KERNEL_') or name.startswith('MEDIAN_'), vars(dai.MedianFilter).keys()))[::-1]
         self.setData(["medianChoices", medianChoices])
-        colorChoices = list(filter(lambda name: name[0].isupper(), vars(dai.ColorCameraProperties.SensorResolution).keys()))
-        self.setData(["colorResolutionChoices", colorChoices])
-        monoChoices = list(filter(lambda name: name[0].isupper(), vars(dai.MonoCameraProperties.SensorResolution).keys()))
-        self.setData(["monoResolutionChoices", monoChoices])
+        self.setData(["colorResolutionChoices", colorResolutionChoices])
+        self.setData(["monoResolutionChoices", monoResolutionChoices])
         self.setData(["modelSourceChoices", [Previews.color.name, Previews.left.name, Previews.right.name]])
-        versionChoices = sorted(filter(lambda name: name.startswith("VERSION_"), vars(dai.OpenVINO).keys()), reverse=True)
-        self.setData(["ovVersions", versionChoices])
+        self.setData(["ovVersions", ovVersionChoices])
         self.createProgressFrame()
         return self.app.exec()